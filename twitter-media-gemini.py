@@ -1,9 +1,18 @@
 import tweepy
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import base64
+import gzip
+import functools
+import hashlib
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
+from urllib.parse import urlparse
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
@@ -14,15 +23,47 @@ import PIL.Image
 import os
 os.environ['GRPC_ENABLE_FORK_SUPPORT'] = '0'
 
+# Fields requested for every timeline fetch, fresh or revalidating
+TWEET_QUERY = {
+    'tweet_fields': ['created_at', 'public_metrics', 'attachments'],
+    'media_fields': ['url', 'preview_image_url'],
+    'expansions': ['attachments.media_keys'],
+    'exclude': ['retweets', 'replies']
+}
+
 class TwitterChatAnalyser:
     def __init__(self):
         self.console = Console()
         self.tweets = []
         self.username = None
+        # Username -> user id, so refreshes skip the get_user round-trip
+        self.user_ids = {}
+        # Question-independent prompt text and images, rebuilt whenever tweets change
+        self._prompt_prefix = None
+        self._images = None
+        # Thumbnail path -> uploaded Gemini file, so images are sent to Google only once
+        self._media_handles = {}
+        # Guards _media_handles, which the background prewarm and analysis both update
+        self._upload_lock = threading.Lock()
+        # Serialises Gemini setup between the prewarm thread and the main thread
+        self._gemini_lock = threading.Lock()
+        # Bumped on every tweet load so an outdated prewarm stops instead of uploading
+        self._load_generation = 0
+        # Set once the prewarm for the current load has finished, with its deferred messages
+        self._prewarm_done = None
+        self._prewarm_messages = []
+        # Media URL -> downloaded path, so reposted images are only fetched once
+        self._url_to_path = {}
         self.cache_dir = Path(__file__).parent / 'cache'
         self.media_dir = self.cache_dir / 'media'
+        self.thumb_dir = self.media_dir / 'thumbs'
         self.cache_dir.mkdir(exist_ok=True)
         self.media_dir.mkdir(exist_ok=True)
+        self.thumb_dir.mkdir(exist_ok=True)
+        # Missing users and deleted media, keyed to an expiry timestamp so retries skip the network
+        self.negative_file = self.cache_dir / 'negative.json'
+        self._negative_lock = threading.Lock()
+        self._negative = self.load_negative_cache()
         self.setup_clients()
 
     def setup_clients(self):
@@ -51,15 +92,58 @@ class TwitterChatAnalyser:
                 # Set the environment variable
                 os.environ['GOOGLE_API_KEY'] = api_key
             
-            # Configure Gemini
-            genai.configure(api_key=api_key)
-            genai.configure(transport="rest")
+            # Gemini is configured lazily on first analysis, see _ensure_gemini
+            self.gemini_api_key = api_key
+            self.model = None
+            
+            # Shared session so parallel media downloads reuse pooled keep-alive connections
+            self.http = requests.Session()
+            self.http.mount('https://', HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=32,
+                max_retries=Retry(total=2, backoff_factor=0.3)
+            ))
+            self.http.headers.update({
+                'User-Agent': 'x-analyser/1.0',
+                'Accept-Encoding': 'gzip, deflate'
+            })
             
             # Initialize Twitter client
             with open(keys_dir / '../../keys/x-token.txt') as f:
                 self.twitter_client = tweepy.Client(bearer_token=f.read().strip())
             
-            # Initialize Gemini model
+        except FileNotFoundError as e:
+            self.console.print(f"[red]Error: Could not find key file: {str(e)}[/red]")
+            exit(1)
+        except Exception as e:
+            self.console.print(f"[red]Error setting up clients: {str(e)}[/red]")
+            exit(1)
+
+    def _report(self, message, messages=None):
+        # Background work collects its messages instead of printing over a waiting prompt
+        if messages is None:
+            self.console.print(message)
+        else:
+            messages.append(message)
+
+    def _ensure_gemini(self, messages=None, quiet_errors=False):
+        """Configure Gemini on first use so cache-only sessions start without contacting it"""
+        with self._gemini_lock:
+            if self.model is not None:
+                return
+            
+            genai.configure(api_key=self.gemini_api_key)
+            genai.configure(transport="rest")
+            
+            # Test the Gemini configuration with a metadata call rather than a billable generation
+            try:
+                next(iter(genai.list_models()), None)
+                self._report("[green]Successfully connected to Gemini API[/green]", messages)
+            except Exception as e:
+                if not quiet_errors:
+                    self._report(f"[red]Error testing Gemini connection: {str(e)}[/red]", messages)
+                raise
+            
             self.model = genai.GenerativeModel('gemini-1.5-pro-latest',
                                              generation_config={
                                                  "max_output_tokens": 2048,
@@ -67,35 +151,25 @@ class TwitterChatAnalyser:
                                                  "top_p": 0.8,
                                                  "top_k": 40
                                              })
-            
-            # Test the Gemini configuration
-            try:
-                test_response = self.model.generate_content("Test connection")
-                self.console.print("[green]Successfully connected to Gemini API[/green]")
-            except Exception as e:
-                self.console.print(f"[red]Error testing Gemini connection: {str(e)}[/red]")
-                raise
-                
-        except FileNotFoundError as e:
-            self.console.print(f"[red]Error: Could not find key file: {str(e)}[/red]")
-            exit(1)
-        except Exception as e:
-            self.console.print(f"[red]Error setting up clients: {str(e)}[/red]")
-            exit(1)
 
     def clear_cache(self, username):
         """Clear cached tweets for a specific user"""
-        cache_file = self.cache_dir / f"{username}_tweets.json"
+        cache_file = self.cache_dir / f"{username}_tweets.json.gz"
         if cache_file.exists():
             try:
                 cache_file.unlink()
-                # Also remove associated media files
+                TwitterChatAnalyser._decode_image.cache_clear()
+                # Remove the uploaded Gemini copies; the files themselves are swept below
                 for tweet in self.tweets:
                     for media_path in tweet['media']:
+                        with self._upload_lock:
+                            handle = self._media_handles.pop(str(self.thumbnail_path(media_path)), None)
                         try:
-                            Path(media_path).unlink()
+                            if handle:
+                                genai.delete_file(handle.name)
                         except:
                             pass
+                self.sweep_media()
                 self.console.print(f"[green]Cache cleared for @{username}[/green]")
                 return True
             except Exception as e:
@@ -103,6 +177,29 @@ class TwitterChatAnalyser:
                 return False
         return False
 
+    def sweep_media(self):
+        """Delete media and thumbnails that no cached user references any more"""
+        # Media files are content-addressed and may be shared between users,
+        # so they can only go once every cache that points at them is gone
+        referenced = set()
+        for cache_file in self.cache_dir.glob('*_tweets.json.gz'):
+            try:
+                data = orjson.loads(gzip.decompress(cache_file.read_bytes()))
+                # Caches without media (e.g. left by older OpenRouter runs) reference nothing
+                for tweet in data.get('tweets', []):
+                    referenced.update(Path(media_path).stem for media_path in tweet.get('media', []))
+            except Exception:
+                # An unreadable cache may still reference files, so keep everything
+                return
+        
+        for directory in (self.media_dir, self.thumb_dir):
+            for media_file in directory.glob('*.jpg'):
+                if media_file.stem not in referenced:
+                    try:
+                        media_file.unlink()
+                    except OSError:
+                        pass
+
     def refresh_tweets(self):
         """Manually refresh tweets for current user"""
         if not self.username:
@@ -110,54 +207,309 @@ class TwitterChatAnalyser:
             return False
         
         self.console.print(f"[cyan]Refreshing tweets for @{self.username}...[/cyan]")
+        # Stop any prewarm still uploading the old tweets
+        with self._upload_lock:
+            self._load_generation += 1
+            self._prompt_prefix = None
+            self._images = None
         self.clear_cache(self.username)
         return self.fetch_tweets(self.username, force_refresh=True)
 
     def load_cached_tweets(self, username):
-        cache_file = self.cache_dir / f"{username}_tweets.json"
+        cache_file = self.cache_dir / f"{username}_tweets.json.gz"
         if cache_file.exists():
             try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                    cache_time = datetime.fromisoformat(data['timestamp'])
-                    # Cache expires after 24 hours
-                    if datetime.now() - cache_time < timedelta(hours=24):
-                        return data['tweets'], cache_time
+                data = orjson.loads(gzip.decompress(cache_file.read_bytes()))
+                cache_time = datetime.fromisoformat(data['timestamp'])
+                if 'user_id' in data:
+                    self.user_ids[username] = data['user_id']
+                # Cache expires after 24 hours
+                if datetime.now() - cache_time < timedelta(hours=24):
+                    return data['tweets'], cache_time
+                # Revalidation only extends the cache up to a week after the last full fetch,
+                # so metrics and deleted tweets are eventually picked up again
+                if 'fetched_at' in data and datetime.now() - datetime.fromisoformat(data['fetched_at']) < timedelta(days=7):
+                    return self.revalidate_cache(username, data)
             except Exception as e:
                 self.console.print(f"[yellow]Warning: Failed to load cache: {str(e)}[/yellow]")
         return None, None
 
-    def save_tweets_to_cache(self, username, tweets):
-        cache_file = self.cache_dir / f"{username}_tweets.json"
+    def revalidate_cache(self, username, data):
+        """Extend an expired cache if the user hasn't tweeted since it was written"""
         try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'timestamp': datetime.now().isoformat(),
-                    'tweets': tweets
-                }, f)
+            tweets = self.twitter_client.get_users_tweets(
+                id=data['user_id'],
+                since_id=data['latest_tweet_id'],
+                max_results=5,
+                **TWEET_QUERY
+            )
+        except Exception as e:
+            self.console.print(f"[yellow]Warning: Failed to revalidate cache: {str(e)}[/yellow]")
+            return None, None
+        
+        if tweets.data and tweets.meta.get('next_token'):
+            # Too many new tweets to merge safely, fall back to a full fetch
+            return None, None
+        
+        cached_tweets = data['tweets']
+        if tweets.data:
+            cached_tweets = (self.build_tweets(tweets) + cached_tweets)[:10]
+        # Older tweets keep their metrics from the last full fetch, so keep its time too
+        self.save_tweets_to_cache(username, cached_tweets, fetched_at=data['fetched_at'])
+        return cached_tweets, datetime.now()
+
+    def save_tweets_to_cache(self, username, tweets, fetched_at=None):
+        cache_file = self.cache_dir / f"{username}_tweets.json.gz"
+        now = datetime.now().isoformat()
+        try:
+            payload = orjson.dumps({
+                'timestamp': now,
+                'fetched_at': fetched_at or now,
+                'user_id': self.user_ids.get(username),
+                'latest_tweet_id': max(t['id'] for t in tweets),
+                'tweets': tweets
+            })
+            # Write to a temp file and swap it in so a crash never leaves a truncated cache
+            tmp_file = cache_file.with_suffix('.tmp')
+            tmp_file.write_bytes(gzip.compress(payload, compresslevel=3))
+            os.replace(tmp_file, cache_file)
         except Exception as e:
             self.console.print(f"[yellow]Warning: Failed to save cache: {str(e)}[/yellow]")
 
+    def load_negative_cache(self):
+        try:
+            return orjson.loads(self.negative_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.console.print(f"[yellow]Warning: Failed to load negative cache: {str(e)}[/yellow]")
+            return {}
+
+    def save_negative_cache(self):
+        now = datetime.now().timestamp()
+        self._negative = {key: expires for key, expires in self._negative.items() if expires > now}
+        try:
+            # Per-process temp name, since the OpenRouter script writes the same file
+            tmp_file = self.negative_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.write_bytes(orjson.dumps(self._negative))
+            os.replace(tmp_file, self.negative_file)
+        except Exception as e:
+            self.console.print(f"[yellow]Warning: Failed to save negative cache: {str(e)}[/yellow]")
+
+    def is_known_missing(self, key):
+        # Re-read so entries written by the other script since startup are seen
+        return self.load_negative_cache().get(key, 0) > datetime.now().timestamp()
+
+    def mark_missing(self, key, ttl):
+        with self._negative_lock:
+            # Merge into the file's current contents rather than overwrite the other script's entries
+            self._negative = self.load_negative_cache()
+            self._negative[key] = (datetime.now() + ttl).timestamp()
+            self.save_negative_cache()
+
+    def clear_missing(self, key):
+        with self._negative_lock:
+            self._negative = self.load_negative_cache()
+            if self._negative.pop(key, None) is not None:
+                self.save_negative_cache()
+
     def download_media(self, media_url, tweet_id):
+        cached_path = self._url_to_path.get(media_url)
+        if cached_path and Path(cached_path).exists():
+            return cached_path
+        
+        if self.is_known_missing(f"media:{media_url}"):
+            return None
+        
+        # Download under a unique temporary name, then store by content hash
+        # so the same image attached to several tweets is kept once
+        media_name = Path(urlparse(media_url).path).stem
+        tmp_path = self.media_dir / f"{tweet_id}_{media_name}.part"
         try:
-            response = requests.get(media_url, timeout=10)
-            if response.status_code == 200:
-                media_path = self.media_dir / f"{tweet_id}.jpg"
-                with open(media_path, 'wb') as f:
-                    f.write(response.content)
-                return str(media_path)
+            with self.http.get(media_url, timeout=10, stream=True) as response:
+                if response.status_code == 200:
+                    digest = hashlib.blake2b(digest_size=8)
+                    with open(tmp_path, 'wb') as f:
+                        for chunk in response.iter_content(64 * 1024):
+                            digest.update(chunk)
+                            f.write(chunk)
+                    
+                    media_path = self.media_dir / f"{digest.hexdigest()}.jpg"
+                    if media_path.exists():
+                        tmp_path.unlink()
+                    else:
+                        os.replace(tmp_path, media_path)
+                    self._url_to_path[media_url] = str(media_path)
+                    self.clear_missing(f"media:{media_url}")
+                    return str(media_path)
+                elif response.status_code == 404:
+                    self.mark_missing(f"media:{media_url}", timedelta(hours=24))
         except Exception as e:
+            # Don't leave a partial download behind if the transfer was cut off
+            tmp_path.unlink(missing_ok=True)
             self.console.print(f"[yellow]Warning: Failed to download media: {str(e)}[/yellow]")
         return None
 
-    def load_image(self, image_path):
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _decode_image(image_path, mtime):
+        # mtime is part of the cache key so a re-downloaded file is decoded again
+        img = PIL.Image.open(image_path)
+        img.load()
+        return img
+
+    def thumbnail_path(self, image_path):
+        return self.thumb_dir / f"{Path(image_path).stem}.jpg"
+
+    def make_thumbnail(self, image_path):
+        """Downscale an image for upload, reusing the on-disk copy while it is fresh"""
+        thumb_path = self.thumbnail_path(image_path)
+        if not thumb_path.exists() or thumb_path.stat().st_mtime < os.path.getmtime(image_path):
+            # Gemini resizes large images itself, so sending full resolution only wastes bandwidth
+            with PIL.Image.open(image_path) as img:
+                img.thumbnail((1024, 1024), PIL.Image.LANCZOS)
+                # Write to a per-thread temp file and swap it in, so a concurrent reader
+                # never uploads a half-written JPEG
+                tmp_path = thumb_path.with_name(f"{thumb_path.stem}.{threading.get_ident()}.tmp")
+                img.convert('RGB').save(tmp_path, 'JPEG', quality=85)
+                os.replace(tmp_path, thumb_path)
+        return str(thumb_path)
+
+    def load_image(self, image_path, messages=None):
         try:
             # Load image using PIL for better compatibility with Gemini
-            img = PIL.Image.open(image_path)
-            return img
+            thumb_path = self.make_thumbnail(image_path)
+            return self._decode_image(thumb_path, os.path.getmtime(thumb_path))
+        except Exception as e:
+            self._report(f"[yellow]Warning: Failed to load image {image_path}: {str(e)}[/yellow]", messages)
+            return None
+
+    def build_tweets(self, tweets):
+        """Convert a get_users_tweets response into cacheable dicts, downloading any media"""
+        media_lookup = {m.media_key: m for m in (tweets.includes.get('media', []) or [])}
+        
+        results = []
+        jobs = []
+        for t in tweets.data:
+            results.append({
+                'id': t.id,
+                'text': t.text,
+                'created_at': t.created_at.isoformat(),
+                'metrics': t.public_metrics,
+                'media': []
+            })
+            
+            if hasattr(t, 'attachments') and t.attachments:
+                media_keys = t.attachments.get('media_keys', [])
+                for key in media_keys:
+                    media = media_lookup.get(key)
+                    if media:
+                        media_url = media.url or media.preview_image_url
+                        if media_url:
+                            jobs.append((t.id, media_url))
+        
+        # Download all media concurrently, then attach paths back to their tweets.
+        # Results are collected in submission order so each tweet keeps its attachment order
+        media_paths = defaultdict(list)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = {executor.submit(self.download_media, url, tweet_id): (tweet_id, url)
+                       for tweet_id, url in jobs}
+            for future, (tweet_id, url) in futures.items():
+                media_path = future.result()
+                if media_path:
+                    media_paths[tweet_id].append(media_path)
+        
+        for tweet_data in results:
+            tweet_data['media'] = media_paths.get(tweet_data['id'], [])
+        return results
+
+    def media_part(self, media_path, messages=None):
+        """Return an uploaded Gemini file for an image, falling back to sending it inline"""
+        try:
+            thumb_path = self.make_thumbnail(media_path)
+            with self._upload_lock:
+                handle = self._media_handles.get(thumb_path)
+            if handle is None:
+                # Upload outside the lock so other threads aren't held up behind the network
+                uploaded = genai.upload_file(path=thumb_path, mime_type='image/jpeg')
+                with self._upload_lock:
+                    handle = self._media_handles.setdefault(thumb_path, uploaded)
+                if handle is not uploaded:
+                    # Another thread uploaded the same image first; don't leave a copy on Google
+                    try:
+                        genai.delete_file(uploaded.name)
+                    except Exception:
+                        pass
+            return handle
         except Exception as e:
-            self.console.print(f"[yellow]Warning: Failed to load image {image_path}: {str(e)}[/yellow]")
+            self._report(f"[yellow]Warning: Failed to upload {media_path}, sending inline: {str(e)}[/yellow]", messages)
+            return self.load_image(media_path, messages)
+
+    def lookup_user_id(self, username):
+        user_id = self.user_ids.get(username)
+        if user_id is not None:
+            return user_id
+        
+        user_key = f"user:{username.lower()}"
+        if self.is_known_missing(user_key):
+            self.console.print(f"[red]User @{username} not found (cached, try again later)[/red]")
             return None
+        
+        user = self.twitter_client.get_user(username=username)
+        
+        if not user.data:
+            self.mark_missing(user_key, timedelta(hours=1))
+            self.console.print(f"[red]User @{username} not found[/red]")
+            return None
+        
+        self.clear_missing(user_key)
+        self.user_ids[username] = user.data.id
+        return user.data.id
+
+    def load_user_tweets(self, username):
+        """Return a user's tweets from cache or Twitter without changing the current user"""
+        cached_tweets, _ = self.load_cached_tweets(username)
+        if cached_tweets:
+            return cached_tweets
+        
+        user_id = self.lookup_user_id(username)
+        if user_id is None:
+            return None
+        
+        tweets = self.twitter_client.get_users_tweets(
+            id=user_id,
+            max_results=10,
+            **TWEET_QUERY
+        )
+        if not tweets.data:
+            return None
+        
+        results = self.build_tweets(tweets)
+        self.save_tweets_to_cache(username, results)
+        return results
+
+    def fetch_tweets_batch(self, usernames):
+        """Load several users concurrently so they can be compared in a single Gemini request"""
+        results = {}
+        with Progress() as progress:
+            task = progress.add_task("[cyan]Fetching tweets...", total=len(usernames))
+            # Each user fans out into a 16-thread media pool, so two at a time stays
+            # within the session's 32 pooled connections
+            with ThreadPoolExecutor(max_workers=min(len(usernames), 2)) as executor:
+                futures = {executor.submit(self.load_user_tweets, username): username
+                           for username in usernames}
+                for future in as_completed(futures):
+                    username = futures[future]
+                    try:
+                        tweets = future.result()
+                        if tweets:
+                            results[username] = tweets
+                    except Exception as e:
+                        self.console.print(f"[red]Error fetching @{username}: {str(e)}[/red]")
+                    progress.advance(task)
+        
+        # Keep the order the users were requested in
+        return {username: results[username] for username in usernames if username in results}
 
     def fetch_tweets(self, username, force_refresh=False):
         self.username = username
@@ -168,6 +520,7 @@ class TwitterChatAnalyser:
                 cached_tweets, cache_time = self.load_cached_tweets(username)
                 if cached_tweets:
                     self.tweets = cached_tweets
+                    self._build_prompt_context()
                     progress.update(task, completed=100)
                     self.console.print(f"[green]Using cached tweets from {cache_time.strftime('%Y-%m-%d %H:%M:%S')}[/green]")
                     return True
@@ -175,49 +528,21 @@ class TwitterChatAnalyser:
             progress.update(task, description="[cyan]Fetching fresh tweets...", completed=30)
             
             try:
-                user = self.twitter_client.get_user(username=username)
-                progress.update(task, advance=20)
-                
-                if not user.data:
-                    self.console.print("[red]User not found[/red]")
+                user_id = self.lookup_user_id(username)
+                if user_id is None:
                     return False
+                progress.update(task, advance=20)
                     
                 tweets = self.twitter_client.get_users_tweets(
-                    id=user.data.id,
+                    id=user_id,
                     max_results=10,
-                    tweet_fields=['created_at', 'public_metrics', 'attachments'],
-                    media_fields=['url', 'preview_image_url'],
-                    expansions=['attachments.media_keys'],
-                    exclude=['retweets', 'replies']
+                    **TWEET_QUERY
                 )
                 
                 if tweets.data:
-                    media_lookup = {m.media_key: m for m in (tweets.includes.get('media', []) or [])}
-                    
-                    self.tweets = []
-                    for t in tweets.data:
-                        tweet_data = {
-                            'id': t.id,
-                            'text': t.text,
-                            'created_at': t.created_at.isoformat(),
-                            'metrics': t.public_metrics,
-                            'media': []
-                        }
-                        
-                        if hasattr(t, 'attachments') and t.attachments:
-                            media_keys = t.attachments.get('media_keys', [])
-                            for key in media_keys:
-                                media = media_lookup.get(key)
-                                if media:
-                                    media_url = media.url or media.preview_image_url
-                                    if media_url:
-                                        media_path = self.download_media(media_url, t.id)
-                                        if media_path:
-                                            tweet_data['media'].append(media_path)
-                        
-                        self.tweets.append(tweet_data)
-                    
+                    self.tweets = self.build_tweets(tweets)
                     self.save_tweets_to_cache(username, self.tweets)
+                    self._build_prompt_context()
                     progress.update(task, completed=100)
                     return True
                     
@@ -226,34 +551,94 @@ class TwitterChatAnalyser:
                 return False
         return False
 
+    def format_tweets(self, tweets):
+        parts = []
+        for tweet in tweets:
+            metrics = tweet['metrics']
+            parts.append(f"\nText: {tweet['text']}\n"
+                         f"Metrics: {metrics['like_count']} likes, {metrics['reply_count']} replies, {metrics['retweet_count']} retweets\n")
+        return "".join(parts)
+
+    def _build_prompt_context(self):
+        """Assemble the tweet text once per load instead of once per question"""
+        parts = ["""Please provide a clear and concise analysis considering both the text content and any images present.
+
+Tweets:
+""", self.format_tweets(self.tweets)]
+        
+        with self._upload_lock:
+            self._load_generation += 1
+            generation = self._load_generation
+            self._prompt_prefix = "".join(parts)
+            self._images = None
+            self._prewarm_messages = []
+            self._prewarm_done = threading.Event()
+        
+        # Upload images while the user is still typing their first question
+        threading.Thread(
+            target=self._prewarm_gemini_uploads,
+            args=(generation, self.tweets, self._prewarm_done),
+            daemon=True
+        ).start()
+
+    def _wait_for_prewarm(self):
+        """Wait for the current load's prewarm so its uploads are reused, then show its messages"""
+        if self._prewarm_done:
+            self._prewarm_done.wait()
+        with self._upload_lock:
+            messages, self._prewarm_messages = self._prewarm_messages, []
+        for message in messages:
+            self.console.print(message)
+
+    def _prewarm_gemini_uploads(self, generation, tweets, done):
+        messages = []
+        try:
+            # A setup failure is reported when analyse_with_gemini retries it on the next question
+            self._ensure_gemini(messages, quiet_errors=True)
+            images = self.media_parts(tweets, messages, generation)
+            # Compare and assign under the lock so a newer load can't reset _images in between
+            with self._upload_lock:
+                if images is not None and generation == self._load_generation:
+                    self._images = images
+                    self._prewarm_messages = messages
+        except Exception:
+            pass
+        finally:
+            done.set()
+
+    def media_parts(self, tweets, messages=None, generation=None):
+        """Collect Gemini parts for tweets' images; returns None if a newer load supersedes the prewarm"""
+        images = []
+        for tweet in tweets:
+            for media_path in tweet['media']:
+                if generation is not None and generation != self._load_generation:
+                    return None
+                part = self.media_part(media_path, messages)
+                if part:
+                    images.append(part)
+        return images
+
     def analyse_with_gemini(self, question):
         if not self.tweets:
             self.console.print("[yellow]No tweets loaded.[/yellow]")
             return
             
+        if self._prompt_prefix is None:
+            self._build_prompt_context()
+            
         with Progress() as progress:
             task = progress.add_task("[cyan]Analysing...", total=100)
             
-            prompt = f"""Analyze these tweets from @{self.username} to answer: {question}
-            
-Please provide a clear and concise analysis considering both the text content and any images present.
-
-Tweets:
-"""
-            images = []
-            
-            for tweet in self.tweets:
-                prompt += f"\nText: {tweet['text']}\n"
-                metrics = tweet['metrics']
-                prompt += f"Metrics: {metrics['like_count']} likes, {metrics['reply_count']} replies, {metrics['retweet_count']} retweets\n"
-                
-                if tweet['media']:
-                    for media_path in tweet['media']:
-                        img = self.load_image(media_path)
-                        if img:
-                            images.append(img)
+            prompt = f"Analyze these tweets from @{self.username} to answer: {question}\n\n{self._prompt_prefix}"
             
             try:
+                self._wait_for_prewarm()
+                
+                self._ensure_gemini()
+                if self._images is None:
+                    self._images = self.media_parts(self.tweets)
+                images = self._images
+                
                 if images:
                     response = self.model.generate_content([prompt, *images])
                 else:
@@ -272,6 +657,64 @@ Tweets:
             except Exception as e:
                 self.console.print(f"[red]Error during analysis: {str(e)}[/red]")
 
+    def analyse_batch(self, user_tweets, question):
+        """Answer a question across several users with one Gemini request"""
+        with Progress() as progress:
+            task = progress.add_task("[cyan]Analysing...", total=100)
+            
+            try:
+                # Interleave each user's images after their own tweets so the model can attribute them
+                contents = [f"""Compare the tweets from these users to answer: {question}
+
+Please provide a clear and concise analysis considering both the text content and any images present.
+"""]
+                # Don't thumbnail and upload the current user's images alongside the prewarm
+                self._wait_for_prewarm()
+                self._ensure_gemini()
+                for username, tweets in user_tweets.items():
+                    contents.append(f"\n### @{username}\n{self.format_tweets(tweets)}")
+                    contents.extend(self.media_parts(tweets))
+                
+                response = self.model.generate_content(contents)
+                
+                progress.update(task, advance=100)
+                
+                if response:
+                    analysis = response.text
+                    self.console.print(Panel(
+                        Markdown(analysis),
+                        title="Comparison",
+                        border_style="cyan"
+                    ))
+                    
+            except Exception as e:
+                self.console.print(f"[red]Error during analysis: {str(e)}[/red]")
+
+    def compare_users(self):
+        others = Prompt.ask(f"Enter usernames to compare with @{self.username} (comma separated, without @)")
+        usernames = [self.username]
+        for username in others.split(','):
+            username = username.strip().lstrip('@')
+            # Twitter handles are case-insensitive, so "Alice" and "alice" are the same account
+            if username and username.lower() not in {name.lower() for name in usernames}:
+                usernames.append(username)
+        
+        if len(usernames) < 2:
+            self.console.print("[yellow]Enter at least one other username[/yellow]")
+            return
+        
+        user_tweets = self.fetch_tweets_batch(usernames)
+        if len(user_tweets) < 2:
+            self.console.print("[red]Need tweets from at least two users to compare[/red]")
+            return
+        
+        names = ", ".join(f"@{username}" for username in user_tweets)
+        while True:
+            question = Prompt.ask(f"What would you like to compare across {names}? (type 'exit' to return to menu)")
+            if question.lower() == 'exit':
+                break
+            self.analyse_batch(user_tweets, question)
+
     def interactive_session(self):
         in_chat = True
         while in_chat:
@@ -280,8 +723,9 @@ Tweets:
                 self.console.print("1. Ask a question")
                 self.console.print("2. Refresh tweets")
                 self.console.print("3. Exit to user selection")
+                self.console.print("4. Compare users")
                 
-                choice = Prompt.ask("Choose an option", choices=["1", "2", "3"])
+                choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4"])
                 
                 if choice == "1":
                     while True:
@@ -296,6 +740,8 @@ Tweets:
                         self.console.print("[red]Failed to refresh tweets[/red]")
                 elif choice == "3":
                     in_chat = False
+                elif choice == "4":
+                    self.compare_users()
                     
             except KeyboardInterrupt:
                 if Confirm.ask("\nDo you want to exit to user selection?"):
@@ -1,6 +1,8 @@
 import tweepy
-import requests
-import json
+import httpx
+import orjson
+import gzip
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from rich.console import Console
@@ -8,14 +10,30 @@ from rich.prompt import Prompt
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.progress import Progress
+from rich.live import Live
+
+# Fields requested for every timeline fetch, fresh or revalidating
+TWEET_QUERY = {
+    'tweet_fields': ['created_at', 'public_metrics'],
+    'exclude': ['retweets', 'replies']
+}
 
 class TwitterChatAnalyser:
     def __init__(self):
         self.console = Console()
         self.tweets = []
         self.username = None
+        # Prompt-ready copy of self.tweets, refreshed whenever tweets are loaded
+        self._serialized_tweets = None
         self.cache_dir = Path(__file__).parent / 'cache'
+        # Tweet caches live in their own directory because the Gemini script writes a
+        # different format under the same usernames in cache/
+        self.tweet_cache_dir = self.cache_dir / 'openrouter'
         self.cache_dir.mkdir(exist_ok=True)
+        self.tweet_cache_dir.mkdir(exist_ok=True)
+        # Missing users keyed to an expiry timestamp, shared with the Gemini script
+        self.negative_file = self.cache_dir / 'negative.json'
+        self._negative = self.load_negative_cache()
         self.setup_clients()
 
     def setup_clients(self):
@@ -27,33 +45,123 @@ class TwitterChatAnalyser:
                 self.twitter_client = tweepy.Client(bearer_token=f.read().strip())
             with open(keys_dir / '../../keys/key-openrouter.txt') as f:
                 self.openrouter_key = f.read().strip()
+            # Reused across questions so each analysis doesn't pay a new TLS handshake
+            self.llm_http = httpx.Client(
+                http2=True,
+                timeout=60,
+                headers={
+                    "Authorization": f"Bearer {self.openrouter_key}",
+                    "HTTP-Referer": "https://github.com/your-repo", # Required by OpenRouter
+                    "X-Title": "Twitter Analyzer"  # Required by OpenRouter
+                }
+            )
         except FileNotFoundError:
             self.console.print("[red]Error: API key files not found in ../../keys/[/red]")
             exit(1)
 
     def load_cached_tweets(self, username):
-        cache_file = self.cache_dir / f"{username}_tweets.json"
+        cache_file = self.tweet_cache_dir / f"{username}_tweets.json.gz"
         if not cache_file.exists():
             return None, None
             
-        with open(cache_file) as f:
-            data = json.load(f)
+        try:
+            data = orjson.loads(gzip.decompress(cache_file.read_bytes()))
             cache_time = datetime.fromisoformat(data['cached_at'])
+        except Exception as e:
+            self.console.print(f"[yellow]Warning: Failed to load cache: {str(e)}[/yellow]")
+            return None, None
             
         if datetime.now() - cache_time > timedelta(hours=24):
-            return None, None
+            # Revalidation only extends the cache up to a week after the last full fetch,
+            # so metrics and deleted tweets are eventually picked up again
+            if 'fetched_at' not in data or datetime.now() - datetime.fromisoformat(data['fetched_at']) > timedelta(days=7):
+                return None, None
+            return self.revalidate_cache(username, data)
             
         return data['tweets'], cache_time
 
-    def save_tweets_to_cache(self, username, tweets):
+    def revalidate_cache(self, username, data):
+        """Extend an expired cache if the user hasn't tweeted since it was written"""
+        try:
+            tweets = self.twitter_client.get_users_tweets(
+                id=data['user_id'],
+                since_id=data['latest_tweet_id'],
+                max_results=5,
+                **TWEET_QUERY
+            )
+        except Exception as e:
+            self.console.print(f"[yellow]Warning: Failed to revalidate cache: {str(e)}[/yellow]")
+            return None, None
+            
+        if tweets.data and tweets.meta.get('next_token'):
+            # Too many new tweets to merge safely, fall back to a full fetch
+            return None, None
+            
+        cached_tweets = data['tweets']
+        if tweets.data:
+            cached_tweets = (self.build_tweets(tweets) + cached_tweets)[:10]
+        # Older tweets keep their metrics from the last full fetch, so keep its time too
+        self.save_tweets_to_cache(username, data['user_id'], cached_tweets, fetched_at=data['fetched_at'])
+        return cached_tweets, datetime.now()
+
+    def save_tweets_to_cache(self, username, user_id, tweets, fetched_at=None):
+        now = datetime.now().isoformat()
         cache_data = {
             'tweets': tweets,
-            'cached_at': datetime.now().isoformat()
+            'user_id': user_id,
+            'latest_tweet_id': max(t['id'] for t in tweets),
+            'cached_at': now,
+            'fetched_at': fetched_at or now
         }
         
-        cache_file = self.cache_dir / f"{username}_tweets.json"
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+        cache_file = self.tweet_cache_dir / f"{username}_tweets.json.gz"
+        # Write to a temp file and swap it in so a crash never leaves a truncated cache
+        tmp_file = cache_file.with_suffix('.tmp')
+        tmp_file.write_bytes(gzip.compress(orjson.dumps(cache_data), compresslevel=3))
+        os.replace(tmp_file, cache_file)
+
+    def load_negative_cache(self):
+        try:
+            return orjson.loads(self.negative_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.console.print(f"[yellow]Warning: Failed to load negative cache: {str(e)}[/yellow]")
+            return {}
+
+    def save_negative_cache(self):
+        now = datetime.now().timestamp()
+        self._negative = {key: expires for key, expires in self._negative.items() if expires > now}
+        try:
+            # Per-process temp name, since the Gemini script writes the same file
+            tmp_file = self.negative_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.write_bytes(orjson.dumps(self._negative))
+            os.replace(tmp_file, self.negative_file)
+        except Exception as e:
+            self.console.print(f"[yellow]Warning: Failed to save negative cache: {str(e)}[/yellow]")
+
+    def is_known_missing(self, key):
+        # Re-read so entries written by the other script since startup are seen
+        return self.load_negative_cache().get(key, 0) > datetime.now().timestamp()
+
+    def mark_missing(self, key, ttl):
+        # Merge into the file's current contents rather than overwrite the other script's entries
+        self._negative = self.load_negative_cache()
+        self._negative[key] = (datetime.now() + ttl).timestamp()
+        self.save_negative_cache()
+
+    def clear_missing(self, key):
+        self._negative = self.load_negative_cache()
+        if self._negative.pop(key, None) is not None:
+            self.save_negative_cache()
+
+    def build_tweets(self, tweets):
+        return [{
+            'id': t.id,
+            'text': t.text,
+            'created_at': t.created_at.isoformat(),
+            'metrics': t.public_metrics
+        } for t in tweets.data]
 
     def fetch_tweets(self, username):
         with Progress() as progress:
@@ -62,6 +170,7 @@ class TwitterChatAnalyser:
             cached_tweets, cache_time = self.load_cached_tweets(username)
             if cached_tweets:
                 self.tweets = cached_tweets
+                self._serialized_tweets = self.format_tweets()
                 progress.update(task, completed=100)
                 self.console.print(f"[green]Using cached tweets from {cache_time.strftime('%Y-%m-%d %H:%M:%S')}[/green]")
                 return True
@@ -69,28 +178,31 @@ class TwitterChatAnalyser:
             progress.update(task, description="[cyan]Fetching fresh tweets...", completed=30)
             
             try:
+                user_key = f"user:{username.lower()}"
+                if self.is_known_missing(user_key):
+                    self.console.print(f"[red]User @{username} not found (cached, try again later)[/red]")
+                    return False
+                
                 user = self.twitter_client.get_user(username=username)
                 progress.update(task, advance=20)
                 
                 if not user.data:
+                    self.mark_missing(user_key, timedelta(hours=1))
                     return False
+                
+                self.clear_missing(user_key)
                     
                 tweets = self.twitter_client.get_users_tweets(
                     id=user.data.id,
                     max_results=10,
-                    tweet_fields=['created_at', 'public_metrics'],
-                    exclude=['retweets', 'replies']
+                    **TWEET_QUERY
                 )
                 
                 if tweets.data:
-                    self.tweets = [{
-                        'id': t.id,
-                        'text': t.text,
-                        'created_at': t.created_at.isoformat(),
-                        'metrics': t.public_metrics
-                    } for t in tweets.data]
+                    self.tweets = self.build_tweets(tweets)
+                    self._serialized_tweets = self.format_tweets()
                     
-                    self.save_tweets_to_cache(username, self.tweets)
+                    self.save_tweets_to_cache(username, user.data.id, self.tweets)
                     progress.update(task, completed=100)
                     return True
                     
@@ -99,55 +211,79 @@ class TwitterChatAnalyser:
                 return False
         return False
 
+    def format_tweets(self):
+        """Serialize tweets as compact NDJSON with short keys to keep the prompt small"""
+        return "\n".join(
+            orjson.dumps({
+                "t": t['text'],
+                "d": t['created_at'],
+                "m": [t['metrics']['like_count'], t['metrics']['reply_count'], t['metrics']['retweet_count']]
+            }).decode()
+            for t in self.tweets
+        )
+
+    def analysis_panel(self, analysis):
+        return Panel(
+            Markdown(analysis),
+            title="Analysis",
+            border_style="cyan"
+        )
+
     def analyse_with_openrouter(self, question, model="anthropic/claude-3-sonnet"):
         if not self.tweets:
             self.console.print("[yellow]No tweets loaded.[/yellow]")
             return
             
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Analysing...", total=100)
-            
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are analyzing Twitter/X user activity. Focus on key patterns in behavior, interests, and communication style. Provide concise, data-driven insights based only on the provided tweets."
-                },
-                {
-                    "role": "user", 
-                    "content": f"Based on these tweets from @{self.username}, {question}\n\nTweets:\n{json.dumps(self.tweets, indent=2)}"
+        messages = [
+            {
+                "role": "system",
+                "content": "You are analyzing Twitter/X user activity. Focus on key patterns in behavior, interests, and communication style. Provide concise, data-driven insights based only on the provided tweets."
+            },
+            {
+                "role": "user", 
+                "content": f"Based on these tweets from @{self.username}, {question}\n\nTweets (one per line; t = text, d = posted at, m = [likes, replies, retweets]):\n{self._serialized_tweets}"
+            }
+        ]
+        
+        try:
+            with self.llm_http.stream(
+                "POST",
+                "https://openrouter.ai/api/v1/chat/completions",
+                json={
+                    "model": model,
+                    "messages": messages,
+                    "temperature": 0.7,
+                    "max_tokens": 1000,
+                    "stream": True
                 }
-            ]
-            
-            try:
-                response = requests.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.openrouter_key}",
-                        "HTTP-Referer": "https://github.com/your-repo", # Required by OpenRouter
-                        "X-Title": "Twitter Analyzer",  # Required by OpenRouter
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": model,
-                        "messages": messages,
-                        "temperature": 0.7,
-                        "max_tokens": 1000
-                    }
-                )
-                progress.update(task, advance=100)
-                
-                if response.status_code == 200:
-                    analysis = response.json()['choices'][0]['message']['content']
-                    self.console.print(Panel(
-                        Markdown(analysis),
-                        title="Analysis",
-                        border_style="cyan"
-                    ))
-                else:
+            ) as response:
+                if response.status_code != 200:
+                    response.read()
                     self.console.print(f"[red]Error {response.status_code}: {response.text}[/red]")
+                    return
+                
+                # Render the answer incrementally as tokens arrive
+                analysis = ""
+                with Live(self.analysis_panel("*Analysing...*"), console=self.console) as live:
+                    for line in response.iter_lines():
+                        # Skip blank separators and OpenRouter's ": PROCESSING" keep-alive comments
+                        if not line.startswith("data: "):
+                            continue
+                        data = line[len("data: "):]
+                        if data == "[DONE]":
+                            break
+                        
+                        chunk = orjson.loads(data)
+                        if 'error' in chunk:
+                            raise RuntimeError(chunk['error'].get('message', chunk['error']))
+                        for choice in chunk.get('choices', []):
+                            content = choice.get('delta', {}).get('content')
+                            if content:
+                                analysis += content
+                                live.update(self.analysis_panel(analysis))
                     
-            except Exception as e:
-                self.console.print(f"[red]Error: {str(e)}[/red]")
+        except Exception as e:
+            self.console.print(f"[red]Error: {str(e)}[/red]")
 
     def start_chat(self):
         self.console.clear()